@@ -1,5 +1,6 @@
 use super::*;
 use engine::*;
+use pyo3::exceptions;
 use pyo3::types::PyDict;
 use pyo3::wrap_pyfunction;
 use std::collections::HashMap;
@@ -60,6 +61,7 @@ pub fn inject_engine(py: Python, engine: Engine) {
     bind!(engine_module, button_down);
     bind!(engine_module, set_viewport);
     bind!(engine_module, set_tile);
+    bind!(engine_module, set_tiles);
     bind!(engine_module, clear);
     bind!(engine_module, resource_read);
     bind!(engine_module, resource_exists);
@@ -230,6 +232,34 @@ fn set_tile(
     );
 }
 
+/// set_tiles(position, width, tiles, colors)
+/// set_tiles(position, width, tiles, colors, flip)
+/// --
+/// Add a row major block of front tiles to the scene, starting at position and wrapping every
+/// width tiles
+#[pyfunction]
+fn set_tiles(
+    position: (i32, i32),
+    width: i32,
+    tiles: Vec<String>,
+    colors: Vec<(u8, u8, u8)>,
+    flip: Option<(bool, bool)>,
+) -> PyResult<()> {
+    if tiles.len() != colors.len() {
+        return Err(exceptions::ValueError::py_err(format!(
+            "set_tiles expected one color per tile, got {} tiles and {} colors",
+            tiles.len(),
+            colors.len()
+        )));
+    }
+
+    let flip = flip.unwrap_or((false, false));
+
+    engine!().set_tiles(position, width, tiles, colors, flip);
+
+    Ok(())
+}
+
 /// clear()
 /// clear all the tiles to none, and modifiers to unflipped and coloured black.
 #[pyfunction]
@@ -162,6 +162,38 @@ impl Engine {
         }
     }
 
+    // API Function
+    pub fn set_tiles(
+        &mut self,
+        position: (i32, i32),
+        width: i32,
+        tiles: Vec<String>,
+        colors: Vec<(u8, u8, u8)>,
+        flip: (bool, bool),
+    ) {
+        let context = match &mut self.graphics_context {
+            Some(c) => c,
+            _ => return,
+        };
+
+        if width <= 0 {
+            return;
+        }
+
+        for (i, (tile, color)) in tiles.iter().zip(colors.into_iter()).enumerate() {
+            let i = i as i32;
+            context.set_tile(
+                (position.0 + i % width, position.1 + i / width),
+                tile,
+                color,
+                flip,
+                "none",
+                (0, 0, 0),
+                (false, false),
+            );
+        }
+    }
+
     // API Function
     pub fn button_down(&mut self, button: String) -> bool {
         self.platform.button_down(button)
@@ -1,4 +1,5 @@
 import sys
+import functools
 import pyrite
 
 from importlib.abc import MetaPathFinder, SourceLoader
@@ -14,10 +15,24 @@ class EngineLoader(SourceLoader):
     def get_data(self, filename):
         return pyrite.resource_read(filename)
 
+# Imports the built-in finders miss each cost an engine probe, so results (hits
+# and misses) are cached by module name until invalidate_caches() is called.
+@functools.lru_cache(maxsize=None)
+def _probe(fullname):
+    return pyrite.resource_exists(f"{fullname}.py")
+
+_loaders = {}
+
 class EngineMetaFinder(MetaPathFinder):
+    def invalidate_caches(self):
+        _probe.cache_clear()
+        _loaders.clear()
+
     def find_spec(self, fullname, path, target=None):
-        if pyrite.resource_exists(f"{fullname}.py"):
-            return ModuleSpec(fullname, EngineLoader(fullname))
+        if _probe(fullname):
+            loader = _loaders.get(fullname)
+            if loader is None:
+                loader = _loaders[fullname] = EngineLoader(fullname)
+            return ModuleSpec(fullname, loader)
 
 sys.meta_path.append(EngineMetaFinder())
-
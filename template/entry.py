@@ -1,6 +1,10 @@
 import pyrite
 import random
 
+_WHITE = (255, 255, 255)
+_BG_TILES = "!@#$%^&*"
+_BG_COLORS = ((1,145,135), (146,196,86), (199,228,128), (221,193,85))
+
 def __config__():
     return {
         # Application name (used for window tile)
@@ -63,18 +67,13 @@ def __event__(event_type, event_data):
 
 
 def draw_string(x, y, s):
-    for i, c in enumerate(s):
-        pyrite.set_tile((x + i, y), c, (255, 255, 255), (False, False))
+    pyrite.set_tiles((x, y), len(s), list(s), [_WHITE] * len(s))
 
 def draw_rect(x, y, width, height, tile, color):
-    for cx in range(width):
-        for cy in range(height):
-            pyrite.set_tile((cx + x, cy + y), tile, color, (False, False)) 
+    pyrite.set_tiles((x, y), width, [tile] * (width * height), [color] * (width * height))
 
 def draw_random_bg():
-    for x in range(59):
-        for y in range(32):
-            tile = random.choice(list("!@#$%^&*"))
-            color = random.choice([(1,145,135), (146,196,86), (199,228,128), (221,193,85)])
-            pyrite.set_tile((x, y), tile, color, (False, False))
+    tiles = random.choices(_BG_TILES, k=59 * 32)
+    colors = random.choices(_BG_COLORS, k=59 * 32)
+    pyrite.set_tiles((0, 0), 59, tiles, colors)
 